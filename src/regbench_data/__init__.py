@@ -1,12 +1,25 @@
 import importlib.metadata
-from importlib.resources import files
-import pooch
+from functools import lru_cache
 
 __version__ = importlib.metadata.version("regbench_data")
 
-POOCH = pooch.create(
-    path=pooch.os_cache("regbench_data"),
-    registry=None,
-    base_url='',
-)
-POOCH.load_registry(files('regbench_data.data').joinpath('registry.txt'))
\ No newline at end of file
+@lru_cache(maxsize=None)
+def _get_pooch():
+    """Creates the pooch instance for the data registry on first use."""
+    import pooch
+    # Generated from data/registry.txt by `python -m regbench_data.gen_registry`.
+    from regbench_data._registry import REGISTRY, URLS
+
+    return pooch.create(
+        path=pooch.os_cache("regbench_data"),
+        registry=dict(REGISTRY),
+        urls=dict(URLS),
+        base_url='',
+    )
+
+def __getattr__(name: str):
+    # `POOCH` is kept as a module attribute for backwards compatibility, but is only
+    # created when first accessed.
+    if name == "POOCH":
+        return _get_pooch()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from regbench_data import POOCH
+from regbench_data.utils import fetch_files
 
 CAGE_DATA = {
     'K562': {
@@ -32,16 +32,16 @@ def retrieve_cage(
     if isinstance(id, str):
         id = [id]
 
-    datasets = {}
     for dataset_id in id:
         if dataset_id not in CAGE_DATA:
-            raise ValueError(f"Dataset ID {dataset_id} not found. Available datasets: {list()}")
-        dataset = CAGE_DATA[dataset_id]
-        datasets[dataset_id] = (
-            Path(POOCH.fetch(dataset['plus'], progressbar=True)),
-            Path(POOCH.fetch(dataset['minus'], progressbar=True))
-        )
-    return datasets
+            raise ValueError(f"Dataset ID {dataset_id} not found. Available datasets: {list_cage()}")
+
+    datasets = {dataset_id: CAGE_DATA[dataset_id] for dataset_id in id}
+    paths = fetch_files([d[strand] for d in datasets.values() for strand in ('plus', 'minus')])
+    return {
+        dataset_id: (paths[d['plus']], paths[d['minus']])
+        for dataset_id, d in datasets.items()
+    }
 
 RNA_DATA = {
     'adipose_subcutaneous': {
@@ -73,13 +73,13 @@ def retrieve_rna(
     if isinstance(id, str):
         id = [id]
 
-    datasets = {}
     for dataset_id in id:
         if dataset_id not in RNA_DATA:
             raise ValueError(f"Dataset ID {dataset_id} not found. Available datasets: {list_rna()}")
-        dataset = RNA_DATA[dataset_id]
-        datasets[dataset_id] = (
-            Path(POOCH.fetch(dataset['plus'], progressbar=True)),
-            Path(POOCH.fetch(dataset['minus'], progressbar=True))
-        )
-    return datasets
\ No newline at end of file
+
+    datasets = {dataset_id: RNA_DATA[dataset_id] for dataset_id in id}
+    paths = fetch_files([d[strand] for d in datasets.values() for strand in ('plus', 'minus')])
+    return {
+        dataset_id: (paths[d['plus']], paths[d['minus']])
+        for dataset_id, d in datasets.items()
+    }
\ No newline at end of file
@@ -1,9 +1,21 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
 from pathlib import Path
-import polars as pl
-import yaml
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, BinaryIO
+
+from regbench_data.utils import _fetch, fetch_files
 
-from regbench_data import POOCH
+# polars and yaml are imported where they are used, so that listing datasets does
+# not pay for their import.
+if TYPE_CHECKING:
+    import polars as pl
 
 ENHANCER_DATA = {
     'Gasperini2019': {
@@ -26,13 +38,18 @@ ENHANCER_DATA = {
     }
 }
 
+# Bump whenever the schema produced by `_scan_tsv` changes, so that stale Parquet
+# sidecars are not picked up.
+_SIDECAR_VERSION = 4
+
 def list_enhancer() -> list[str]:
     """Lists all available datasets."""
     return list(ENHANCER_DATA.keys())
 
 def retrieve_enhancer(
     id: str | list[str] | None = None,
-    p_value: float | None = None
+    p_value: float | None = None,
+    processes: bool = False,
 ) -> dict[str, 'Dataset']:
     """Retrieves all datasets.
 
@@ -43,28 +60,65 @@ def retrieve_enhancer(
     p_value : float | None, optional
         If provided, modify the 'label' column in each ScreeningResult based on the adjusted p-value.
         Otherwise, the 'label' column is left unchanged.
+    processes : bool, optional
+        If True, decode the data files in separate processes instead of threads. This
+        avoids contention on the GIL when many files are loaded at once, at the cost of
+        starting the worker processes and copying the results back.
 
     Returns
     -------
     dict[str, Dataset]
         A dictionary mapping dataset IDs to Dataset objects.
     """
+    from tqdm import tqdm
 
     if id is None:
         id = list_enhancer()
     elif isinstance(id, str):
         id = [id]
 
-    datasets = {}
     for dataset_id in id:
         if dataset_id not in ENHANCER_DATA:
             raise ValueError(f"Dataset ID {dataset_id} not found. Available datasets: {list_enhancer()}")
-        dataset = ENHANCER_DATA[dataset_id]
-        metadata = POOCH.fetch(dataset['metadata_file'])
-        for d in dataset['data']:
-            data = [(d['name'], POOCH.fetch(d['data_file'], progressbar=True))]
-            datasets[dataset_id] = Dataset.load(metadata, data, p_value=p_value)
-    return datasets
+
+    metadata_paths = fetch_files([ENHANCER_DATA[dataset_id]['metadata_file'] for dataset_id in id])
+    metadata = {
+        dataset_id: _load_metadata(metadata_paths[ENHANCER_DATA[dataset_id]['metadata_file']])
+        for dataset_id in id
+    }
+
+    # Network and CPU are independent resources: each data file is handed to the
+    # decoder pool as soon as its download completes, so parsing earlier files
+    # overlaps with downloading later ones.
+    results = {
+        dataset_id: [_new_result(metadata[dataset_id], d['name']) for d in ENHANCER_DATA[dataset_id]['data']]
+        for dataset_id in id
+    }
+    jobs = [
+        (d['data_file'], result)
+        for dataset_id in id
+        for d, result in zip(ENHANCER_DATA[dataset_id]['data'], results[dataset_id])
+    ]
+    n_decoders = max(1, min(os.cpu_count() or 1, len(jobs)))
+    if processes:
+        # Only paths and primitives cross the process boundary. polars is not fork-safe,
+        # so the workers are spawned.
+        decoder = ProcessPoolExecutor(n_decoders, mp_context=multiprocessing.get_context("spawn"))
+    else:
+        decoder = ThreadPoolExecutor(n_decoders)
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(jobs)))) as fetcher, decoder:
+        fetches = {fetcher.submit(_fetch, data_file): result for data_file, result in jobs}
+        loads = {
+            decoder.submit(_load_frame, future.result(), p_value): fetches[future]
+            for future in tqdm(as_completed(fetches), total=len(fetches), desc="Fetching", unit="file")
+        }
+        for future, result in loads.items():
+            result.result = future.result()
+
+    return {
+        dataset_id: Dataset(metadata[dataset_id]["id"], results[dataset_id])
+        for dataset_id in id
+    }
 
 @dataclass
 class ScreeningResult:
@@ -81,13 +135,13 @@ class ScreeningResult:
     result : pl.DataFrame
         The results of the screening, loaded as a Polars DataFrame.
         It contains the following columns:
-            - chrom: str
+            - chrom: str (categorical)
             - chrom_start: int
             - chrom_end: int
-            - gene_symbol: str
-            - gene_chrom: str
+            - gene_symbol: str (categorical)
+            - gene_chrom: str (categorical)
             - gene_TSS: int
-            - label: str (categorical, e.g., '0' for non-significant and '1' for significant)
+            - label: int (0 for non-significant and 1 for significant)
             - effect_size: float | None
             - adjusted_p_value: float | None
     """
@@ -100,49 +154,198 @@ class ScreeningResult:
     def __len__(self):
         return len(self.result)
 
-    def label_counts(self) -> dict[str, int]:
-        return self.result["label"].value_counts().sort("label")
+    def label_counts(self) -> pl.DataFrame:
+        """Counts the number of rows per label."""
+        return self.label_counts_streaming([self.result.lazy()])
+
+    @staticmethod
+    def label_counts_streaming(lazy_frames: list[pl.LazyFrame]) -> pl.DataFrame:
+        """Counts the number of rows per label across multiple lazy frames.
+
+        The frames are counted with the streaming engine and are never concatenated in
+        memory, so this is the way to count labels across many screening results, e.g.,
+        the frames returned by `ScreeningResult.scan`.
+        """
+        import polars as pl
+
+        return (
+            pl.concat(lazy_frames, how="vertical_relaxed")
+            .group_by("label")
+            .agg(pl.len().alias("count"))
+            .sort("label")
+            .collect(engine="streaming")
+        )
+
+    def rechunk(self) -> "ScreeningResult":
+        """Rechunks the result into contiguous memory, e.g., after `concatenate`."""
+        self.result = self.result.rechunk()
+        return self
     
     def distance_to_tss(self) -> pl.Series:
-        """Calculates the distance from the enhancer center to the gene TSS."""
-        return ((self.result["chrom_start"] + self.result["chrom_end"]) / 2 - self.result["gene_TSS"]).abs()
+        """Calculates the distance from the enhancer center to the gene TSS.
+
+        The enhancer center is rounded down to an integer coordinate.
+        """
+        return self.result.select(distance_to_tss_expr()).to_series()
 
     def load_data(
         self, csv: Path, p_value: float | None = None
     ) -> "ScreeningResult":
-        """Loads the screening results from an OSF object.
+        """Loads the screening results from a TSV file.
 
         Parameters
         ----------
-        object : OsfObject
-            The OSF object containing the screening results.
+        csv : Path
+            The local path to the (gzipped) TSV file containing the screening results.
         p_value : float | None, optional
             If provided, modify the 'label' column based on the adjusted p-value.
             Otherwise, the 'label' column is left unchanged.
         """
-        df = pl.read_csv(
-            csv,
-            separator="\t",
-            schema_overrides={
-                "chrom": pl.String,
-                "chrom_start": pl.UInt64,
-                "chrom_end": pl.UInt64,
-                "gene_symbol": pl.String,
-                "gene_chrom": pl.String,
-                "gene_TSS": pl.UInt64,
-                "label": pl.Int64,
-            },
-            null_values={"effect_size": "NA", "adjusted_p_value": "NA"},
-        )
+        self.result = _load_frame(Path(csv), p_value)
+        return self
+
+    @staticmethod
+    def scan(csv: Path, p_value: float | None = None) -> pl.LazyFrame:
+        """Lazily scans the screening results from a TSV file.
+
+        Parameters
+        ----------
+        csv : Path
+            The local path to the (gzipped) TSV file containing the screening results.
+        p_value : float | None, optional
+            If provided, modify the 'label' column based on the adjusted p-value.
+            Otherwise, the 'label' column is left unchanged.
+        """
+        import polars as pl
+
+        lf = _scan_tsv(Path(csv))
         if p_value is not None:
-            df = df.with_columns(
-                pl.when(pl.col("adjusted_p_value") <= p_value)
-                .then(1)
-                .otherwise(0)
-                .cast(pl.Int64)
+            # Missing p-values count as non-significant, as with when/then/otherwise.
+            lf = lf.with_columns(
+                (pl.col("adjusted_p_value") <= p_value)
+                .fill_null(False)
+                .cast(pl.Int8)
                 .alias("label")
             )
-        self.result = df
+        return lf
+
+
+def distance_to_tss_expr() -> pl.Expr:
+    """Returns an expression computing the distance from the enhancer center to the gene TSS.
+
+    Use this instead of `ScreeningResult.distance_to_tss` to attach the distance to a
+    (lazy) frame with `with_columns` or `filter`. The arithmetic stays in Int64, so
+    coordinates are not cast to floats.
+    """
+    import polars as pl
+
+    center = (pl.col("chrom_start").cast(pl.Int64) + pl.col("chrom_end").cast(pl.Int64)) // 2
+    return (center - pl.col("gene_TSS").cast(pl.Int64)).abs().alias("distance_to_tss")
+
+
+def _load_frame(csv: Path, p_value: float | None) -> pl.DataFrame:
+    """Loads a screening TSV; a module-level function so it can run in worker processes."""
+    return ScreeningResult.scan(csv, p_value=p_value).collect(engine="streaming")
+
+
+def _new_result(metadata: dict, filename: str) -> ScreeningResult:
+    """Creates an empty ScreeningResult for a data file listed in the dataset metadata."""
+    info = next((x for x in metadata["data"] if x["file"] == filename), None)
+    if info is None:
+        raise ValueError(f"File {filename} not found in metadata")
+    return ScreeningResult(
+        info["sample_term_id"],
+        info["sample_name"],
+        info["assembly"],
+        None,
+    )
+
+
+def _load_metadata(path: Path) -> dict:
+    """Parses a dataset metadata file, reusing earlier parses of the same file."""
+    return _parse_metadata(path, path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=None)
+def _parse_metadata(path: Path, mtime_ns: int) -> dict:
+    import yaml
+
+    # Prefer the libyaml-backed loader, which ships with the PyYAML wheels.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=loader)
+
+
+def _open_gzip(path: Path) -> BinaryIO | None:
+    """Opens a gzipped file with an accelerated decompressor, if one is installed.
+
+    rapidgzip decodes DEFLATE blocks in parallel across all cores and is preferred;
+    ISA-L is single-threaded but still faster than zlib. Returns None when neither
+    is available, in which case polars should decompress the file itself; that is
+    faster than going through the standard library's gzip module.
+    """
+    if path.suffix != ".gz":
+        return None
+    try:
+        import rapidgzip
+    except ImportError:
+        pass
+    else:
+        return rapidgzip.RapidgzipFile(str(path), parallelization=os.cpu_count() or 1)
+    try:
+        from isal import igzip
+    except ImportError:
+        return None
+    return igzip.open(path, "rb")
+
+
+def _scan_tsv(csv: Path) -> pl.LazyFrame:
+    """Scans a screening TSV, caching it as a Parquet sidecar next to the source file.
+
+    The source files are immutable once fetched, so the CSV parse only has to be paid
+    once. The sidecar holds the file as published; label recomputation happens on top
+    of the scan. A sidecar older than its source is considered stale and rebuilt.
+    """
+    import polars as pl
+
+    sidecar = csv.with_suffix(f".v{_SIDECAR_VERSION}.parquet")
+    if sidecar.exists() and sidecar.stat().st_mtime >= csv.stat().st_mtime:
+        return pl.scan_parquet(sidecar)
+
+    options = dict(
+        separator="\t",
+        schema_overrides={
+            "chrom": pl.Categorical,
+            "chrom_start": pl.UInt64,
+            "chrom_end": pl.UInt64,
+            "gene_symbol": pl.Categorical,
+            "gene_chrom": pl.Categorical,
+            "gene_TSS": pl.UInt64,
+            "label": pl.Int8,
+        },
+        null_values="NA",
+    )
+    stream = _open_gzip(csv)
+    if stream is None:
+        lf = pl.scan_csv(csv, **options)
+    else:
+        with stream:
+            lf = pl.read_csv(stream, **options).lazy()
+
+    # Write to a temporary file first so concurrent readers never see a partial sidecar.
+    tmp = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        try:
+            lf.sink_parquet(tmp, compression="zstd", statistics=True)
+            os.replace(tmp, sidecar)
+        except BaseException:
+            # E.g., a parse error surfacing in the lazy scan; never leave a partial file.
+            tmp.unlink(missing_ok=True)
+            raise
+    except OSError:
+        # The cache may be read-only; the sidecar is only an optimization.
+        return lf
+    return pl.scan_parquet(sidecar)
 
 
 def concatenate(
@@ -164,24 +367,30 @@ def concatenate(
     ScreeningResult
         A new ScreeningResult object containing the concatenated results.
     """
+    import polars as pl
+
     assert len(results) > 0, "No results to concatenate"
 
-    if isinstance(results[0], tuple):
-        for key, r in results:
-            r.result = r.result.with_columns(pl.lit(key).alias("source"))
-        results = [r for _, r in results]
-
-    sample_term_id = results[0].sample_term_id
-    sample_name = results[0].sample_name
-    assembly = results[0].assembly
-    for r in results:
-        if r.sample_term_id != sample_term_id:
-            raise ValueError("All results must have the same sample_term_id")
-        if r.sample_name != sample_name:
-            raise ValueError("All results must have the same sample_name")
-        if r.assembly != assembly:
-            raise ValueError("All results must have the same assembly")
-    concatenated_df = pl.concat([r.result for r in results], how="vertical")
+    keyed = isinstance(results[0], tuple)
+    samples = {
+        (r.sample_term_id, r.sample_name, r.assembly)
+        for r in ([r for _, r in results] if keyed else results)
+    }
+    if len(samples) != 1:
+        raise ValueError("All results must have the same sample_term_id, sample_name and assembly")
+    sample_term_id, sample_name, assembly = samples.pop()
+
+    # Keep the per-result chunks; see `ScreeningResult.rechunk` for contiguous memory.
+    if keyed:
+        # A categorical literal stores one code per row instead of a copy of the key.
+        frames = [
+            r.result.lazy().with_columns(pl.lit(key, dtype=pl.Categorical).alias("source"))
+            for key, r in results
+        ]
+        concatenated_df = pl.concat(frames, how="vertical_relaxed", rechunk=False).collect(engine="streaming")
+    else:
+        # Without a column to add, an eager concatenation just links the existing chunks.
+        concatenated_df = pl.concat([r.result for r in results], how="vertical_relaxed", rechunk=False)
     return ScreeningResult(sample_term_id, sample_name, assembly, concatenated_df)
 
 
@@ -204,27 +413,26 @@ class Dataset:
     def load(
         cls,
         metadata: Path,
-        data: list[tuple[str, Path]],
+        data: Iterable[tuple[str, Path]],
         p_value: float | None = None,
     ) -> "Dataset":
-        with open(metadata, "r") as f:
-            metadata = yaml.safe_load(f)
-
-        files = {x["file"]: x for x in metadata["data"]}
-        results = []
-        for filename, d in data:
-            info = files.get(filename)
-            if info is None:
-                raise ValueError(f"File {filename} not found in metadata")
-            res = ScreeningResult(
-                info["sample_term_id"],
-                info["sample_name"],
-                info["assembly"],
-                None,
-            )
-            res.load_data(d, p_value=p_value)
-            results.append(res)
+        """Loads a dataset from its metadata file and local data files.
 
+        Parameters
+        ----------
+        metadata : Path
+            The local path to the dataset metadata YAML file.
+        data : Iterable[tuple[str, Path]]
+            Pairs of file names, as listed in the metadata, and local paths to the files.
+        p_value : float | None, optional
+            If provided, modify the 'label' column in each ScreeningResult based on the
+            adjusted p-value. Otherwise, the 'label' column is left unchanged.
+        """
+        metadata = _load_metadata(Path(metadata))
+        results = [
+            _new_result(metadata, filename).load_data(d, p_value=p_value)
+            for filename, d in data
+        ]
         return Dataset(metadata["id"], results)
 
 if __name__ == "__main__":
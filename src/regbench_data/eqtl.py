@@ -1,9 +1,11 @@
-from pathlib import Path
-import polars as pl
-import yaml
-from dataclasses import dataclass
+from __future__ import annotations
 
-from regbench_data import POOCH
+from typing import TYPE_CHECKING
+
+from regbench_data.utils import fetch_files
+
+if TYPE_CHECKING:
+    import polars as pl
 
 EQTL_DATA = {
     'adipose_subcutaneous': 'GTEx_v10_SuSiE_eQTL_Adipose_Subcutaneous.v10.eQTLs.SuSiE_summary.parquet',
@@ -15,18 +17,27 @@ def list_eqtl() -> list[str]:
 
 def retrieve_eqtl(
     id: str | list[str],
-) -> dict[str, pl.DataFrame]:
+    columns: list[str] | None = None,
+    lazy: bool = False,
+) -> dict[str, pl.DataFrame] | dict[str, pl.LazyFrame]:
     """Retrieves all datasets.
 
     Parameters
     ----------
     ids : str | list[str]
         The ID or list of IDs of the datasets to retrieve.
+    columns : list[str] | None, optional
+        The columns to load. Unused columns are not read from disk. If None, loads
+        all columns.
+    lazy : bool, optional
+        If True, return LazyFrames instead of DataFrames, so that downstream filters
+        (e.g., on `pip`) are pushed down into the Parquet scan.
 
     Returns
     -------
-    dict[str, pl.DataFrame]
-        A dictionary mapping dataset IDs to Polars DataFrames. The DataFrames contain the following columns:
+    dict[str, pl.DataFrame] | dict[str, pl.LazyFrame]
+        A dictionary mapping dataset IDs to Polars DataFrames (or LazyFrames if `lazy`
+        is True). The DataFrames contain the following columns:
             - gene_id: GENCODE/Ensembl gene ID or RNAcentral URS ID
             - phenotype_id: Phenotype ID, e.g., intron coordinates and cluster combined with gene ID for sQTLs
             - gene_name: GENCODE gene name
@@ -40,15 +51,22 @@ def retrieve_eqtl(
             - afc_se: standard error of the aFC of the lead variant (highest PIP) in the credible set
     """
 
+    import polars as pl
+
     if isinstance(id, str):
         id = [id]
 
-    datasets = {}
     for dataset_id in id:
         if dataset_id not in EQTL_DATA:
             raise ValueError(f"Dataset ID {dataset_id} not found. Available datasets: {list_eqtl()}")
-        data_file = POOCH.fetch(EQTL_DATA[dataset_id], progressbar=True)
-        datasets[dataset_id] = pl.read_parquet(data_file)
+
+    paths = fetch_files([EQTL_DATA[dataset_id] for dataset_id in id])
+    datasets = {}
+    for dataset_id in id:
+        lf = pl.scan_parquet(paths[EQTL_DATA[dataset_id]], hive_partitioning=False)
+        if columns is not None:
+            lf = lf.select(columns)
+        datasets[dataset_id] = lf if lazy else lf.collect(engine="streaming")
     return datasets
 
 if __name__ == "__main__":
@@ -0,0 +1,74 @@
+"""Generates `regbench_data/_registry.py` from `data/registry.txt`.
+
+The registry is compiled into a Python module so that it does not have to be
+parsed at runtime. Run this after editing `data/registry.txt`::
+
+    python -m regbench_data.gen_registry
+
+Pass ``--check`` to fail instead of writing when the generated module is stale.
+The script does not import the package, so it can also be run from a plain
+checkout, e.g., in CI, as ``python src/regbench_data/gen_registry.py --check``.
+"""
+import shlex
+import sys
+from pathlib import Path
+
+SOURCE = Path(__file__).with_name("data") / "registry.txt"
+OUTPUT = Path(__file__).with_name("_registry.py")
+
+HEADER = """\
+# This file is generated by `python -m regbench_data.gen_registry` from
+# data/registry.txt. Do not edit it by hand.
+"""
+
+def parse_registry(text: str) -> tuple[dict[str, str], dict[str, str]]:
+    """Parses a pooch registry file into its hashes and URLs.
+
+    The format is the one accepted by `pooch.Pooch.load_registry`: one file per line,
+    followed by its hash and an optional download URL. Lines starting with '#' are
+    comments.
+    """
+    registry = {}
+    urls = {}
+    for linenum, line in enumerate(text.splitlines(), start=1):
+        line = line.strip()
+        if line.startswith("#"):
+            continue
+        elements = shlex.split(line)
+        if not elements:
+            continue
+        if len(elements) not in (2, 3):
+            raise ValueError(
+                f"Invalid registry entry in line {linenum}: expected 2 or 3 elements "
+                f"but got {len(elements)}"
+            )
+        registry[elements[0]] = elements[1].lower()
+        if len(elements) == 3:
+            urls[elements[0]] = elements[2]
+    return registry, urls
+
+def render(registry: dict[str, str], urls: dict[str, str]) -> str:
+    """Renders the registry as the source of a Python module."""
+    lines = [HEADER, "REGISTRY: dict[str, str] = {"]
+    lines.extend(f"    {name!r}: {hash!r}," for name, hash in registry.items())
+    lines.append("}")
+    lines.append("")
+    lines.append("URLS: dict[str, str] = {")
+    lines.extend(f"    {name!r}: {url!r}," for name, url in urls.items())
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    text = SOURCE.read_text(encoding="utf-8")
+    source = render(*parse_registry(text))
+    if "--check" in argv:
+        if not OUTPUT.exists() or OUTPUT.read_text(encoding="utf-8") != source:
+            print(f"{OUTPUT} is out of date; run `python -m regbench_data.gen_registry`.")
+            return 1
+        return 0
+    OUTPUT.write_text(source, encoding="utf-8")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
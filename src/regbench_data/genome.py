@@ -1,5 +1,4 @@
 from pathlib import Path
-import pooch
 
 def fetch_genome_fasta(name: str) -> Path:
     """ Fetches the genome FASTA file for the specified genome assembly.
@@ -14,6 +13,8 @@ def fetch_genome_fasta(name: str) -> Path:
     if name not in registy:
         raise ValueError(f"Unknown genome: {name}")
     
+    import pooch
+
     file_name, url, hash_value = registy[name]
     return pooch.retrieve(
         url,
@@ -37,6 +38,8 @@ def fetch_genome_annotation(name: str) -> Path:
     if name not in registy:
         raise ValueError(f"Unknown genome: {name}")
     
+    import pooch
+
     file_name, url, hash_value = registy[name]
     return pooch.retrieve(
         url,
@@ -1,8 +1,443 @@
+import contextlib
+import ctypes
+import errno
+import hashlib
+import mmap
+import os
+import queue
+import stat
+import tempfile
+import threading
 from pathlib import Path
-import pooch
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from functools import lru_cache
 
-@dataclass
+from regbench_data import _get_pooch
+
+def _fetch(name: str) -> Path:
+    """ Fetches a file from the registry, memoizing the local path in-process.
+
+    `Pooch.fetch` re-hashes an already cached file on every call, which dominates
+    repeated retrievals of large files. Set the REGBENCH_REFRESH environment variable
+    to 1 to bypass the memo and always go through pooch, e.g., for integrity checks.
+    """
+    if os.environ.get("REGBENCH_REFRESH") == "1":
+        return Path(_get_pooch().fetch(name, progressbar=False))
+    return _fetch_cached(name)
+
+@lru_cache(maxsize=None)
+def _fetch_cached(name: str) -> Path:
+    return Path(_get_pooch().fetch(name, progressbar=False))
+
+def fetch_files(names: list[str], max_workers: int = 8) -> dict[str, Path]:
+    """ Fetches files from the registry concurrently.
+
+    Downloads are network-latency-bound, so the files are fetched in a thread pool
+    and collected in completion order, letting a slow transfer overlap with the
+    others instead of blocking them.
+
+    Parameters
+    ----------
+    names : list[str]
+        The registry names of the files to fetch.
+    max_workers : int, optional
+        The maximum number of concurrent downloads.
+
+    Returns
+    -------
+    dict[str, Path]
+        A dictionary mapping registry names to local paths.
+    """
+    from tqdm import tqdm
+
+    names = list(dict.fromkeys(names))
+    paths = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(names)))) as executor:
+        futures = {executor.submit(_fetch, name): name for name in names}
+        for future in tqdm(as_completed(futures), total=len(futures), desc="Fetching", unit="file"):
+            paths[futures[future]] = future.result()
+    return paths
+
+
+# Maximum number of pooled connections, i.e., of concurrent downloads that can reuse a
+# connection.
+_POOL_SIZE = 32
+
+# Size of the chunks in which files are streamed.
+_CHUNK_SIZE = 1024 * 1024
+
+@lru_cache(maxsize=None)
+def _session():
+    """ Returns the HTTP session shared by all OSF downloads.
+
+    Reusing one session keeps connections alive across files, so TCP and TLS
+    handshakes are paid once per connection instead of once per file. Failed
+    connections and transient 502, 503 and 504 responses are retried by urllib3 with
+    exponential backoff, honoring Retry-After.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import Retry
+
+    adapter = HTTPAdapter(
+        pool_connections=_POOL_SIZE,
+        pool_maxsize=_POOL_SIZE,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def _parse_hash(hash: str) -> tuple[str, str]:
+    """ Splits a hash of the form "alg:hexdigest" into its parts; defaults to SHA256. """
+    alg, _, digest = hash.rpartition(":")
+    return (alg or "sha256").lower(), digest.lower()
+
+def _new_hasher(alg: str):
+    """ Creates a hash object for the given algorithm.
+
+    Besides the algorithms of `hashlib`, supports "blake3" (requires the blake3
+    package) and "xxh3" (128-bit, requires the xxhash package). Both hash at several
+    GB/s, so verification no longer bottlenecks fast downloads the way SHA256 can.
+    """
+    if alg == "blake3":
+        import blake3
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+    if alg == "xxh3":
+        import xxhash
+        return xxhash.xxh3_128()
+    return hashlib.new(alg)
+
+# Slice size for hashing memory-mapped files, a multiple of the page size.
+_HASH_BLOCK = 1 << 22
+
+def _file_hash(path: Path, alg: str) -> str:
+    """ Computes the hex digest of a file on disk.
+
+    The file is memory-mapped and hashed straight from the page cache, which saves the
+    copy into a read buffer. BLAKE3 hashes the whole mapping at once, on all cores.
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Empty files cannot be mapped, nor can files on some special filesystems.
+            return _read_hash(f, alg)
+    try:
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        with memoryview(mm) as view:
+            if alg == "blake3":
+                import blake3
+                return blake3.blake3(view, max_threads=blake3.blake3.AUTO).hexdigest()
+            hasher = _new_hasher(alg)
+            for i in range(0, len(view), _HASH_BLOCK):
+                hasher.update(view[i:i + _HASH_BLOCK])
+            return hasher.hexdigest()
+    finally:
+        mm.close()
+
+def _read_hash(f, alg: str) -> str:
+    """ Computes the hex digest of an open binary file by reading it. """
+    if hasattr(hashlib, "file_digest"):
+        return hashlib.file_digest(f, lambda: _new_hasher(alg)).hexdigest()
+    hasher = _new_hasher(alg)
+    while chunk := f.read(_CHUNK_SIZE):
+        hasher.update(chunk)
+    return hasher.hexdigest()
+
+# Downloads at least this large write to disk on a background thread.
+_BACKGROUND_WRITE_MIN = 64 * 1024 * 1024
+
+# How many times a download that breaks off midway is resumed before giving up.
+_RESUME_ATTEMPTS = 5
+
+class _BackgroundWriter:
+    """ Writes chunks to a file on a separate thread.
+
+    The write syscalls release the GIL, so writing one chunk overlaps with receiving
+    and hashing the next. At most `depth` chunks are queued at once.
+    """
+    def __init__(self, file, depth: int = 8):
+        self._file = file
+        self.depth = depth
+        self._queue = queue.Queue(maxsize=depth)
+        self._error = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while (chunk := self._queue.get()) is not None:
+            if self._error is None:
+                try:
+                    self._file.write(chunk)
+                except BaseException as e:
+                    self._error = e
+
+    def write(self, chunk) -> None:
+        if self._error is not None:
+            raise self._error
+        self._queue.put(chunk)
+
+    def close(self, raise_error: bool = True) -> None:
+        """ Waits for the queued chunks to be written and stops the thread. """
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._thread.join()
+        if raise_error and self._error is not None:
+            raise self._error
+
+class _SharedProgress:
+    """ A byte progress bar shared by concurrent downloads.
+
+    Downloads add their size to the total once it is known and report each chunk, so a
+    batch of files draws one bar instead of setting up and tearing down one per file.
+    """
+    def __init__(self, desc: str | None = None, disable: bool = False):
+        from tqdm import tqdm
+        self._bar = tqdm(total=0, unit="B", unit_scale=True, desc=desc, disable=disable)
+        self._lock = threading.Lock()
+
+    def add_total(self, n: int):
+        with self._lock:
+            self._bar.total += n
+            self._bar.refresh()
+
+    def update(self, n: int):
+        with self._lock:
+            self._bar.update(n)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._bar.close()
+
+    @contextlib.contextmanager
+    def track(self, total: int | None):
+        """ Counts a download of `total` bytes towards the bar. """
+        if total:
+            self.add_total(total)
+        yield self
+
+def _progress(progressbar, total: int | None):
+    """ Returns a context manager yielding the bar a download reports its chunks to. """
+    from tqdm import tqdm
+    if isinstance(progressbar, _SharedProgress):
+        return progressbar.track(total)
+    return tqdm(total=total, unit="B", unit_scale=True, disable=not progressbar)
+
+def _download(
+    url: str,
+    path: str | Path,
+    hash: str | None = None,
+    progressbar: bool | _SharedProgress = False,
+) -> None:
+    """ Downloads a file through the shared HTTP session.
+
+    The file is hashed while it is written, so verifying it does not need a second
+    pass over the downloaded file.
+
+    Parameters
+    ----------
+    url : str
+        The URL to download.
+    path : str | Path
+        The file to write to.
+    hash : str | None, optional
+        The expected hash of the file, as "alg:hexdigest" or a bare SHA256 hex digest.
+        See `_new_hasher` for the supported algorithms.
+        If None, the file is not verified.
+    progressbar : bool | _SharedProgress, optional
+        Whether to show a progress bar for the download, or a shared bar to report to.
+    """
+    import requests
+    from urllib3.exceptions import ProtocolError, ReadTimeoutError
+
+    alg, expected = _parse_hash(hash) if hash is not None else (None, None)
+    hasher = _new_hasher(alg) if alg is not None else None
+    response = _session().get(url, stream=True, timeout=30)
+    try:
+        response.raise_for_status()
+        total = int(response.headers.get("content-length", 0)) or None
+        # Byte ranges refer to the body as sent, so only plain bodies can be resumed.
+        resumable = response.headers.get("content-encoding", "identity") == "identity"
+        out = open(path, "wb")
+        writer = None
+        if total is not None and total >= _BACKGROUND_WRITE_MIN:
+            writer = _BackgroundWriter(out)
+        write = writer.write if writer is not None else out.write
+        # The body is read into preallocated buffers rather than a new bytes object
+        # per chunk. Chunks handed to the background writer may still be queued or
+        # being written, so it gets enough buffers to never overwrite one of them.
+        slots = writer.depth + 2 if writer is not None else 1
+        ring = [memoryview(bytearray(_CHUNK_SIZE)) for _ in range(slots)]
+        try:
+            with _progress(progressbar, total) as bar:
+                i = 0
+                received = 0
+                for attempt in range(_RESUME_ATTEMPTS + 1):
+                    try:
+                        if attempt > 0:
+                            # The session only retries requests, not a body that
+                            # breaks off midway, so continue from the last byte.
+                            response.close()
+                            response = _get_from(url, received)
+                        response.raw.decode_content = True
+                        while n := response.raw.readinto(ring[i]):
+                            chunk = ring[i][:n]
+                            write(chunk)
+                            if hasher is not None:
+                                hasher.update(chunk)
+                            bar.update(n)
+                            received += n
+                            i = (i + 1) % len(ring)
+                        break
+                    except (ProtocolError, ReadTimeoutError, requests.ConnectionError,
+                            requests.Timeout):
+                        if not resumable or attempt == _RESUME_ATTEMPTS:
+                            raise
+            if writer is not None:
+                writer.close()
+        finally:
+            if writer is not None:
+                writer.close(raise_error=False)
+            out.close()
+    finally:
+        response.close()
+    if hasher is not None:
+        _check_digest(hasher.hexdigest(), alg, expected, url)
+
+def _get_from(url: str, offset: int):
+    """ Requests the body of `url` from byte `offset` onwards.
+
+    Servers that ignore the range send the whole body, in which case the first `offset`
+    bytes are skipped so that the caller can carry on where it stopped.
+    """
+    from urllib3.exceptions import ProtocolError
+
+    headers = {"Range": f"bytes={offset}-"}
+    response = _session().get(url, stream=True, timeout=30, headers=headers)
+    try:
+        response.raise_for_status()
+        if response.status_code != 206:
+            while offset > 0:
+                skipped = len(response.raw.read(min(offset, _CHUNK_SIZE)))
+                if skipped == 0:
+                    raise ProtocolError("Connection closed before the resume offset")
+                offset -= skipped
+    except BaseException:
+        response.close()
+        raise
+    return response
+
+def _check_digest(digest: str, alg: str, expected: str, url: str):
+    """ Raises a ValueError if the digest of a finished download is not the expected one. """
+    if digest != expected:
+        raise ValueError(
+            f"{alg.upper()} hash of downloaded file from {url} does not match the known "
+            f"hash: expected {expected}, got {digest}."
+        )
+
+class _RangesUnsupported(Exception):
+    """ Raised when a server answers a range request with the whole body. """
+
+def _fetch_range(url: str, fd: int, start: int, end: int, bar) -> None:
+    """ Downloads bytes `start` to `end` (inclusive) of `url` into the same offsets of `fd`.
+
+    A range that breaks off midway is resumed from its last byte, like in
+    `_download`.
+    """
+    import requests
+    from urllib3.exceptions import ProtocolError, ReadTimeoutError
+
+    view = memoryview(bytearray(_CHUNK_SIZE))
+    offset = start
+    for attempt in range(_RESUME_ATTEMPTS + 1):
+        try:
+            headers = {"Range": f"bytes={offset}-{end}"}
+            with _session().get(url, stream=True, timeout=30, headers=headers) as response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise _RangesUnsupported(url)
+                while offset <= end and (n := response.raw.readinto(view[:end + 1 - offset])):
+                    written = 0
+                    while written < n:
+                        written += os.pwrite(fd, view[written:n], offset + written)
+                    offset += n
+                    bar.update(n)
+            if offset <= end:
+                raise ProtocolError(f"Connection closed at byte {offset} of range {start}-{end}")
+            return
+        except (ProtocolError, ReadTimeoutError, requests.ConnectionError, requests.Timeout):
+            if attempt == _RESUME_ATTEMPTS:
+                raise
+
+@lru_cache(maxsize=None)
+def _default_cache() -> Path:
+    """ Returns the default cache folder for OSF objects, resolved once per process. """
+    import pooch
+    return Path(pooch.os_cache("regbench_data"))
+
+# Fetches of OSF objects, keyed by object and destination path. Entries are added before
+# the fetch starts, so concurrent fetches of the same file wait for the first one. The
+# key includes the expected hash, so a fetch with a different hash is checked anew.
+_INFLIGHT: dict[tuple["OsfObject", Path], Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+# Prefetched files at least this large also have their pages touched on a background
+# thread, one page in every `_TOUCH_STRIDE` pages, to make sure they are read in.
+_TOUCH_MIN = 256 * 1024 * 1024
+_TOUCH_STRIDE = 64
+
+def _touch_pages(fd: int, size: int) -> None:
+    """ Reads one byte of every `_TOUCH_STRIDE` pages of a file, then closes it. """
+    try:
+        step = mmap.PAGESIZE * _TOUCH_STRIDE
+        for offset in range(0, size, step):
+            os.pread(fd, 1, offset)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def _temp_file(path: Path) -> tuple[int, str]:
+    """ Creates a temporary file next to `path` to download into.
+
+    The cache folder is only created when the file cannot be made, so downloads into an
+    existing folder skip the extra filesystem calls.
+    """
+    kwargs = dict(dir=path.parent, prefix=f".{path.name}.", suffix=".part")
+    try:
+        return tempfile.mkstemp(**kwargs)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return tempfile.mkstemp(**kwargs)
+
+def _writable_view(buf) -> memoryview:
+    """ Returns a writable byte view of a buffer or a contiguous CPU tensor. """
+    if hasattr(buf, "data_ptr"):
+        if buf.device.type != "cpu" or not buf.is_contiguous():
+            raise ValueError("Tensor buffers must be contiguous and on the CPU")
+        nbytes = buf.element_size() * buf.nelement()
+        return memoryview((ctypes.c_char * nbytes).from_address(buf.data_ptr())).cast("B")
+    view = memoryview(buf).cast("B")
+    if view.readonly:
+        raise ValueError("Buffer must be writable")
+    return view
+
+@dataclass(slots=True, frozen=True)
 class OsfObject:
     """ Represents an object stored on the Open Science Framework (OSF).
 
@@ -13,30 +448,452 @@ class OsfObject:
     name : str
         The name of the file to be downloaded.
     hash : str | None
-        The SHA256 hash of the file for integrity checking. If None, no hash check is
-        performed.
+        The hash of the file for integrity checking, as "alg:hexdigest", e.g.,
+        "blake3:..." or "xxh3:...". A bare hex digest is taken to be SHA256. If None, no
+        hash check is performed. Prefer BLAKE3 for multi-GB files: cached copies are
+        verified with it on all cores, while SHA256 runs on a single core.
     """
     id: str
     name: str
     hash: str | None = None
 
-    def __post_init__(self):
-        self.url = f"https://osf.io/download/{self.id}"
+    @property
+    def url(self) -> str:
+        """ The download URL of the OSF object. """
+        return f"https://osf.io/download/{self.id}"
 
-    def fetch(self, cache_dir: Path | None = None) -> Path:
+    def fetch(self, cache_dir: Path | None = None, progressbar: bool = True) -> Path:
         """ Fetches the OSF object and returns the local path to the downloaded file.
 
         Parameters
         ----------
         cache_dir: Path | None, optional
             The location of the cache folder on disk. This is where the file will be saved.
-            If None, will save to a folder in the default cache location for your
-            operating system (see pooch.os_cache).
-        """
-        return pooch.retrieve(
-            self.url,
-            known_hash=self.hash,
-            fname=self.name,
-            path=cache_dir,
-            progressbar=True,
-        )
\ No newline at end of file
+            If None, will save to the "regbench_data" folder in the default cache
+            location for your operating system (see pooch.os_cache).
+        progressbar: bool, optional
+            Whether to show a progress bar for the download.
+        """
+        cache = Path(cache_dir) if cache_dir is not None else _default_cache()
+        path = cache / self.name
+        if os.environ.get("REGBENCH_REFRESH") == "1":
+            return self._retrieve(path, progressbar)
+
+        # Concurrent and repeated fetches of the same file within the process share the
+        # first fetch, instead of downloading or re-verifying the file again.
+        key = (self, path)
+        with _INFLIGHT_LOCK:
+            future = _INFLIGHT.get(key)
+            owner = future is None
+            if owner:
+                future = _INFLIGHT[key] = Future()
+        if not owner:
+            return future.result()
+        try:
+            future.set_result(self._retrieve(path, progressbar))
+        except BaseException as e:
+            with _INFLIGHT_LOCK:
+                del _INFLIGHT[key]
+            future.set_exception(e)
+            raise
+        return future.result()
+
+    def _is_cached(self, path: Path) -> bool:
+        """ Checks whether `path` holds a complete copy of the object. """
+        if not path.exists():
+            return False
+        if self.hash is None:
+            return True
+        alg, expected = _parse_hash(self.hash)
+        return _file_hash(path, alg) == expected
+
+    def _retrieve(self, path: Path, progressbar: bool | _SharedProgress) -> Path:
+        if self._is_cached(path):
+            return path
+
+        # Download to a temporary file and only move it into place once it has been
+        # verified, so that the cache never holds a partial or corrupt file.
+        fd, tmp = _temp_file(path)
+        os.close(fd)
+        try:
+            _download(self.url, tmp, self.hash, progressbar=progressbar)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return path
+
+    def open_mmap(self, cache_dir: Path | None = None, advise: str = "sequential") -> memoryview:
+        """ Fetches the OSF object and returns its content as a read-only memory map.
+
+        The content is mapped straight from the page cache instead of being read into a
+        Python bytes object, which avoids a copy and a second resident copy of the file.
+        Consumers can stay zero-copy with, e.g., `np.frombuffer(view, dtype=...)`. The
+        mapping is released once the returned memoryview is garbage collected.
+
+        Parameters
+        ----------
+        cache_dir: Path | None, optional
+            The location of the cache folder on disk. See `OsfObject.fetch`.
+        advise: str, optional
+            The expected access pattern, "sequential" or "random", used to tune the
+            kernel's read-ahead where supported.
+        """
+        if advise not in ("sequential", "random"):
+            raise ValueError(f"Invalid advise: {advise!r}")
+        path = self.fetch(cache_dir)
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return memoryview(b"")
+            # The map keeps its own reference to the file, so it can be closed here.
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        flag = {"sequential": "MADV_SEQUENTIAL", "random": "MADV_RANDOM"}[advise]
+        if hasattr(mmap, flag):
+            mm.madvise(getattr(mmap, flag))
+        return memoryview(mm)
+
+    def prefetch(self, cache_dir: Path | None = None, advise: str = "sequential") -> Path:
+        """ Fetches the OSF object and asks the kernel to load it into the page cache.
+
+        Returns right away while the kernel reads the file in the background, so the
+        first consumer of the file reads from memory instead of the disk. Large files
+        are additionally touched page by page on a daemon thread. This is a no-op
+        beyond fetching on platforms without `os.posix_fadvise`, such as Windows.
+
+        Parameters
+        ----------
+        cache_dir: Path | None, optional
+            The location of the cache folder on disk. See `OsfObject.fetch`.
+        advise: str, optional
+            The expected access pattern, "sequential" or "random". Random access also
+            turns off the kernel's read-ahead for the file.
+        """
+        if advise not in ("sequential", "random"):
+            raise ValueError(f"Invalid advise: {advise!r}")
+        path = self.fetch(cache_dir)
+        if not hasattr(os, "posix_fadvise"):
+            return path
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            if advise == "random":
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_RANDOM)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            size = os.fstat(fd).st_size
+        except BaseException:
+            os.close(fd)
+            raise
+        if advise == "sequential" and size >= _TOUCH_MIN:
+            # The thread takes over the file descriptor and closes it when done.
+            threading.Thread(target=_touch_pages, args=(fd, size), daemon=True).start()
+        else:
+            os.close(fd)
+        return path
+
+    def fetch_into(self, fd_out: int, cache_dir: Path | None = None) -> int:
+        """ Fetches the OSF object and writes its content to a file descriptor.
+
+        The bytes are copied inside the kernel, with `os.splice` when `fd_out` is a pipe
+        and `os.sendfile` otherwise, so they never pass through a user-space buffer.
+        This is the recommended way to stream a file into a subprocess or a socket.
+        Platforms without these calls fall back to a plain read/write loop.
+
+        Parameters
+        ----------
+        fd_out: int
+            The file descriptor to write to, e.g., a pipe, socket or open file.
+        cache_dir: Path | None, optional
+            The location of the cache folder on disk. See `OsfObject.fetch`.
+
+        Returns
+        -------
+        int
+            The number of bytes written.
+        """
+        path = self.fetch(cache_dir)
+        fd_in = os.open(path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd_in).st_size
+            offset = 0
+            if hasattr(os, "splice") and stat.S_ISFIFO(os.fstat(fd_out).st_mode):
+                while offset < size:
+                    n = os.splice(fd_in, fd_out, min(_CHUNK_SIZE, size - offset), offset_src=offset)
+                    if n == 0:
+                        break
+                    offset += n
+                return offset
+            if hasattr(os, "sendfile"):
+                try:
+                    while offset < size:
+                        n = os.sendfile(fd_out, fd_in, offset, min(_CHUNK_SIZE, size - offset))
+                        if n == 0:
+                            break
+                        offset += n
+                    return offset
+                except OSError as e:
+                    # E.g., macOS only supports sockets as the destination.
+                    if offset > 0 or e.errno not in (errno.EINVAL, errno.ENOTSOCK, errno.ENOSYS):
+                        raise
+            while chunk := os.read(fd_in, _CHUNK_SIZE):
+                view = memoryview(chunk)
+                while view:
+                    view = view[os.write(fd_out, view):]
+                offset += len(chunk)
+            return offset
+        finally:
+            os.close(fd_in)
+
+    def download_to_buffer(self, buf) -> int:
+        """ Downloads the OSF object straight into a caller-provided buffer.
+
+        The file is streamed from the network into `buf` and hashed in place, without
+        touching the disk cache. This suits consumers that move the data to a GPU right
+        away: download into a pinned CPU tensor and follow up with
+        `tensor.to("cuda", non_blocking=True)`.
+
+        Parameters
+        ----------
+        buf: memoryview | bytearray | torch.Tensor
+            A writable buffer, or a contiguous CPU tensor (preferably pinned), that is
+            large enough to hold the file.
+
+        Returns
+        -------
+        int
+            The number of bytes written to the start of `buf`.
+        """
+        view = _writable_view(buf)
+        alg, expected = _parse_hash(self.hash) if self.hash is not None else (None, None)
+        hasher = _new_hasher(alg) if alg is not None else None
+        offset = 0
+        with _session().get(self.url, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            total = int(response.headers.get("content-length", 0))
+            if total > len(view):
+                raise ValueError(f"Buffer of {len(view)} bytes is too small for {total} bytes")
+            response.raw.decode_content = True
+            while n := response.raw.readinto(view[offset:offset + _CHUNK_SIZE]):
+                if hasher is not None:
+                    hasher.update(view[offset:offset + n])
+                offset += n
+                if offset == len(view) and response.raw.read(1):
+                    raise ValueError(f"Buffer of {len(view)} bytes is too small for {self.url}")
+        if hasher is not None:
+            _check_digest(hasher.hexdigest(), alg, expected, self.url)
+        return offset
+
+    @classmethod
+    def fetch_many(
+        cls,
+        objs: list["OsfObject"],
+        cache_dir: Path | None = None,
+        max_workers: int = 8,
+        progress: bool = True,
+    ) -> list[Path]:
+        """ Fetches multiple OSF objects concurrently.
+
+        The downloads share one pool of keep-alive connections, so pulling many small
+        files does not pay a new TCP and TLS handshake per file. They also share one
+        progress bar for all bytes, rather than drawing a bar per file.
+
+        Parameters
+        ----------
+        objs: list[OsfObject]
+            The OSF objects to fetch.
+        cache_dir: Path | None, optional
+            The location of the cache folder on disk. See `OsfObject.fetch`.
+        max_workers: int, optional
+            The maximum number of concurrent downloads.
+        progress: bool, optional
+            Whether to show a progress bar for the downloads.
+
+        Returns
+        -------
+        list[Path]
+            The local paths to the downloaded files, in the same order as `objs`.
+        """
+        paths = [None] * len(objs)
+        progressbar = _SharedProgress(desc="Fetching") if progress else contextlib.nullcontext(False)
+        workers = max(1, min(max_workers, len(objs)))
+        with progressbar as bar, ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(obj.fetch, cache_dir, progressbar=bar): i
+                for i, obj in enumerate(objs)
+            }
+            for future in as_completed(futures):
+                paths[futures[future]] = future.result()
+        return paths
+
+    def fetch_ranged(
+        self,
+        cache_dir: Path | None = None,
+        parts: int = 4,
+        progressbar: bool = True,
+    ) -> Path:
+        """ Fetches a large OSF object over several connections at once.
+
+        The file is split into `parts` byte ranges that are downloaded in parallel and
+        written straight to their offsets in a preallocated file. This helps when the
+        server caps the throughput of a single connection below the available bandwidth.
+        The assembled file is verified before it is moved into the cache. Falls back to
+        `OsfObject.fetch` for small files, for servers that do not support ranges, and
+        on platforms without `os.pwrite`.
+
+        Parameters
+        ----------
+        cache_dir: Path | None, optional
+            The location of the cache folder on disk. See `OsfObject.fetch`.
+        parts: int, optional
+            The number of ranges to download in parallel.
+        progressbar: bool, optional
+            Whether to show a progress bar for the download.
+        """
+        cache = Path(cache_dir) if cache_dir is not None else _default_cache()
+        path = cache / self.name
+        if os.environ.get("REGBENCH_REFRESH") != "1" and self._is_cached(path):
+            return path
+        if parts < 2 or not hasattr(os, "pwrite"):
+            return self.fetch(cache_dir, progressbar)
+
+        with _session().head(self.url, allow_redirects=True, timeout=30) as head:
+            if not head.ok:
+                # E.g., HEAD is not allowed; a real error will resurface in `fetch`.
+                return self.fetch(cache_dir, progressbar)
+            size = int(head.headers.get("content-length", 0))
+            # Ranges are resolved against the final URL, so the parts skip the redirects.
+            url = head.url
+            plain = head.headers.get("content-encoding", "identity") == "identity"
+            ranges = head.headers.get("accept-ranges", "bytes") != "none"
+        if not (plain and ranges) or size < parts * _CHUNK_SIZE:
+            return self.fetch(cache_dir, progressbar)
+
+        fd, tmp = _temp_file(path)
+        try:
+            try:
+                try:
+                    os.posix_fallocate(fd, 0, size)
+                except (AttributeError, OSError):
+                    # Not available on all platforms and filesystems.
+                    os.ftruncate(fd, size)
+                step = -(-size // parts)
+                bounds = [(a, min(a + step, size) - 1) for a in range(0, size, step)]
+                with (
+                    _SharedProgress(disable=not progressbar) as bar,
+                    ThreadPoolExecutor(max_workers=len(bounds)) as executor,
+                ):
+                    bar.add_total(size)
+                    futures = [executor.submit(_fetch_range, url, fd, a, b, bar) for a, b in bounds]
+                    for future in as_completed(futures):
+                        future.result()
+            finally:
+                os.close(fd)
+            if self.hash is not None:
+                alg, expected = _parse_hash(self.hash)
+                _check_digest(_file_hash(Path(tmp), alg), alg, expected, self.url)
+            os.replace(tmp, path)
+        except _RangesUnsupported:
+            Path(tmp).unlink(missing_ok=True)
+            return self.fetch(cache_dir, progressbar)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return path
+
+    async def fetch_async(
+        self,
+        session,
+        cache_dir: Path | None = None,
+        progressbar: bool = False,
+    ) -> Path:
+        """ Fetches the OSF object on an event loop and returns the local path to the file.
+
+        The response is streamed in chunks, hashed on the fly and written to a temporary
+        file that is moved into place once verified, like `OsfObject.fetch`. Requires
+        the optional `aiohttp` dependency (`pip install regbench_data[async]`).
+
+        Parameters
+        ----------
+        session: aiohttp.ClientSession
+            The session to download with. Sharing one session across fetches reuses its
+            connection pool; see `OsfObject.fetch_many_async`.
+        cache_dir: Path | None, optional
+            The location of the cache folder on disk. See `OsfObject.fetch`.
+        progressbar: bool, optional
+            Whether to show a progress bar for the download.
+        """
+        import asyncio
+
+        cache = Path(cache_dir) if cache_dir is not None else _default_cache()
+        path = cache / self.name
+        refresh = os.environ.get("REGBENCH_REFRESH") == "1"
+        if not refresh and await asyncio.to_thread(self._is_cached, path):
+            return path
+
+        alg, expected = _parse_hash(self.hash) if self.hash is not None else (None, None)
+        hasher = _new_hasher(alg) if alg is not None else None
+        fd, tmp = _temp_file(path)
+        try:
+            # Chunks are written with plain blocking writes: they land in the page cache
+            # and return quickly, so a thread hop per chunk would cost more than it saves.
+            with os.fdopen(fd, "wb") as out:
+                async with session.get(self.url) as response:
+                    response.raise_for_status()
+                    with _progress(progressbar, response.content_length) as bar:
+                        async for chunk in response.content.iter_chunked(_CHUNK_SIZE):
+                            out.write(chunk)
+                            if hasher is not None:
+                                hasher.update(chunk)
+                            bar.update(len(chunk))
+            if hasher is not None:
+                _check_digest(hasher.hexdigest(), alg, expected, self.url)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return path
+
+    @classmethod
+    async def fetch_many_async(
+        cls,
+        objs: list["OsfObject"],
+        cache_dir: Path | None = None,
+        progress: bool = True,
+    ) -> list[Path]:
+        """ Fetches multiple OSF objects concurrently on an event loop.
+
+        All downloads share one aiohttp session, so hundreds of files can be in flight
+        without a thread per download. Requires the optional `aiohttp` dependency
+        (`pip install regbench_data[async]`).
+
+        Parameters
+        ----------
+        objs: list[OsfObject]
+            The OSF objects to fetch. Duplicates are only downloaded once.
+        cache_dir: Path | None, optional
+            The location of the cache folder on disk. See `OsfObject.fetch`.
+        progress: bool, optional
+            Whether to show one progress bar for all downloads.
+
+        Returns
+        -------
+        list[Path]
+            The local paths to the downloaded files, in the same order as `objs`.
+        """
+        import asyncio
+
+        try:
+            import aiohttp
+        except ImportError as e:
+            raise ImportError(
+                "OsfObject.fetch_many_async requires aiohttp; install it with "
+                "`pip install regbench_data[async]`"
+            ) from e
+        unique = list(dict.fromkeys(objs))
+        connector = aiohttp.TCPConnector(limit=64, limit_per_host=32, ttl_dns_cache=300)
+        progressbar = _SharedProgress(desc="Fetching") if progress else contextlib.nullcontext(False)
+        with progressbar as bar:
+            async with aiohttp.ClientSession(connector=connector) as session:
+                paths = await asyncio.gather(
+                    *(obj.fetch_async(session, cache_dir, progressbar=bar) for obj in unique)
+                )
+        found = dict(zip(unique, paths))
+        return [found[obj] for obj in objs]